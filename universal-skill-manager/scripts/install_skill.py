@@ -9,7 +9,7 @@ Usage:
     python3 install_skill.py --url "https://github.com/user/repo/tree/main/skills/my-skill" --dest "~/.claude/skills/my-skill"
 
 Features:
-    - Atomic install: Downloads to temp, validates, then moves to destination
+    - Atomic install: Downloads to temp, validates, then renames into place
     - Multi-file validation: Validates .py, .sh, .json, .yaml files
     - Single API call: Only one GitHub API request to list directory
     - Raw URL downloads: No rate limiting for file downloads
@@ -17,6 +17,10 @@ Features:
 
 import argparse
 import ast
+import errno
+import http.client
+import importlib.util
+import io
 import json
 import os
 import re
@@ -24,19 +28,57 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import urllib.error
 import urllib.request
 import hashlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 from typing import Optional
+from urllib.parse import quote, urljoin, urlsplit
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 VERSION = "1.1.0"
 
+# Concurrent raw file downloads; kept small to stay clear of GitHub abuse limits
+DOWNLOAD_WORKERS = 8
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Download cache size; least recently used bodies are evicted beyond it
+DOWNLOAD_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Read size when hashing local files for the update diff
+HASH_CHUNK_SIZE = 1024 * 1024
+# hashlib releases the GIL on large buffers; bounded to avoid thrashing HDDs
+HASH_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+# Rate-limit handling: retries on 429/403, longest wait worth sleeping through,
+# fallback backoff base, and remaining-quota level below which requests are paced
+RATE_LIMIT_RETRIES = 3
+RATE_LIMIT_MAX_WAIT = 60
+RATE_LIMIT_BACKOFF = 1.0
+RATE_LIMIT_LOW_WATER = 10
+
+# Below this many files, validating in-process beats process pool startup
+PARALLEL_VALIDATION_MIN_FILES = 16
+
 
 # =============================================================================
 # URL Parsing
 # =============================================================================
 
+# Pattern: github.com/{owner}/{repo}/tree/{branch}/{path...} (path optional)
+_GITHUB_TREE_RE = re.compile(r'https?://github\.com/([^/]+)/([^/]+)/tree/([^/]+)(?:/(.+?))?/?$')
+
 def parse_github_url(url: str) -> Optional[dict]:
     """
     Parse a GitHub tree URL into components.
@@ -47,9 +89,7 @@ def parse_github_url(url: str) -> Optional[dict]:
     
     Returns None if URL is not a valid GitHub tree URL.
     """
-    # Pattern: github.com/{owner}/{repo}/tree/{branch}/{path...} (path optional)
-    pattern = r'https?://github\.com/([^/]+)/([^/]+)/tree/([^/]+)(?:/(.+?))?/?$'
-    match = re.match(pattern, url)
+    match = _GITHUB_TREE_RE.match(url)
     
     if not match:
         return None
@@ -62,13 +102,18 @@ def parse_github_url(url: str) -> Optional[dict]:
     }
 
 
+@lru_cache(maxsize=256)
+def _encode_path(path: str) -> str:
+    """URL-encode each segment of a repo path (cached: every file in a directory shares it)."""
+    return '/'.join(quote(p, safe='') for p in path.split('/'))
+
+
 def to_raw_url(owner: str, repo: str, branch: str, path: str, filename: str) -> str:
     """Convert GitHub components to raw.githubusercontent.com URL."""
     # URL-encode the filename to handle spaces and special characters
-    from urllib.parse import quote
     encoded_filename = quote(filename, safe='')
     if path:
-        encoded_path = '/'.join(quote(p, safe='') for p in path.split('/'))
+        encoded_path = _encode_path(path)
         return f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{encoded_path}/{encoded_filename}"
     else:
         return f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{encoded_filename}"
@@ -82,10 +127,151 @@ def to_api_url(owner: str, repo: str, branch: str, path: str) -> str:
         return f"https://api.github.com/repos/{owner}/{repo}/contents?ref={branch}"
 
 
+def to_tree_url(owner: str, repo: str, branch: str) -> str:
+    """Convert GitHub components to recursive Git Trees API URL."""
+    return f"https://api.github.com/repos/{owner}/{repo}/git/trees/{quote(branch, safe='')}?recursive=1"
+
+
 # =============================================================================
 # GitHub API & Downloads
 # =============================================================================
 
+_connections = threading.local()
+
+
+def _get_connection(host: str) -> http.client.HTTPSConnection:
+    """Return this thread's keep-alive connection to host, creating it if needed."""
+    pool = getattr(_connections, "pool", None)
+    if pool is None:
+        pool = _connections.pool = {}
+    conn = pool.get(host)
+    if conn is None:
+        conn = pool[host] = http.client.HTTPSConnection(host, timeout=30)
+    return conn
+
+
+def _drop_connection(host: str) -> None:
+    """Close and forget this thread's connection to host."""
+    conn = getattr(_connections, "pool", {}).pop(host, None)
+    if conn is not None:
+        conn.close()
+
+
+# Last X-RateLimit-Remaining reported per host
+_rate_limit_remaining: dict = {}
+
+
+def _rate_limit_wait(error: urllib.error.HTTPError, attempt: int) -> Optional[float]:
+    """
+    Return seconds to wait before retrying a rate-limited request, or None if
+    the error isn't a rate limit or the reset is too far away to wait for.
+    """
+    headers = error.headers or {}
+    retry_after = headers.get("Retry-After")
+    limited = (
+        error.code == 429
+        or (error.code == 403 and (headers.get("X-RateLimit-Remaining") == "0" or retry_after))
+    )
+    if not limited:
+        return None
+
+    reset = headers.get("X-RateLimit-Reset")
+    if retry_after and retry_after.isdigit():
+        wait = float(retry_after)
+    elif reset and reset.isdigit():
+        wait = max(0.0, int(reset) - time.time()) + 1
+    else:
+        wait = RATE_LIMIT_BACKOFF * 2 ** attempt
+    return wait if wait <= RATE_LIMIT_MAX_WAIT else None
+
+
+@contextmanager
+def open_url(url: str, headers: dict, max_redirects: int = 5):
+    """
+    GET a URL, reusing one keep-alive HTTPS connection per host and thread.
+
+    Raises urllib.error.HTTPError / URLError like urllib.request.urlopen, so
+    callers handle errors the same way. When an HTTPS proxy is configured the
+    request goes through urllib instead, which knows how to use it.
+
+    Rate-limited responses (429, or 403 with an exhausted quota) are retried
+    after Retry-After / X-RateLimit-Reset, and requests are paced once a host
+    reports that its remaining quota is low.
+    """
+    host = urlsplit(url).netloc
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        remaining = _rate_limit_remaining.get(host)
+        if remaining is not None and remaining < RATE_LIMIT_LOW_WATER:
+            time.sleep(1)
+
+        with ExitStack() as stack:
+            try:
+                response = stack.enter_context(_open_url_once(url, headers, max_redirects))
+            except urllib.error.HTTPError as e:
+                wait = _rate_limit_wait(e, attempt)
+                if wait is None or attempt == RATE_LIMIT_RETRIES:
+                    raise
+                print(f"  Rate limited by GitHub, retrying in {wait:.0f}s...")
+                time.sleep(wait)
+                continue
+
+            remaining = response.headers.get("X-RateLimit-Remaining")
+            if remaining and remaining.isdigit():
+                _rate_limit_remaining[host] = int(remaining)
+            yield response
+            return
+
+
+@contextmanager
+def _open_url_once(url: str, headers: dict, max_redirects: int = 5):
+    """Perform a single GET for open_url, following redirects."""
+    parts = urlsplit(url)
+    host = parts.netloc
+
+    if urllib.request.getproxies().get('https') and not urllib.request.proxy_bypass(host):
+        request = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(request, timeout=30) as response:
+            yield response
+        return
+
+    target = parts.path + (f"?{parts.query}" if parts.query else "")
+    for attempt in range(2):
+        conn = _get_connection(host)
+        reused = conn.sock is not None
+        try:
+            conn.request("GET", target, headers=headers)
+            response = conn.getresponse()
+        except (http.client.HTTPException, OSError) as e:
+            _drop_connection(host)
+            # The server may have closed an idle keep-alive socket; retry once on a fresh one
+            if reused and attempt == 0:
+                continue
+            raise urllib.error.URLError(e)
+        break
+
+    try:
+        if response.status in (301, 302, 303, 307, 308) and max_redirects > 0:
+            location = response.getheader("Location")
+            response.read()
+            if location:
+                with _open_url_once(urljoin(url, location), headers, max_redirects - 1) as redirected:
+                    yield redirected
+                return
+        if response.status >= 400:
+            body = response.read()
+            raise urllib.error.HTTPError(url, response.status, response.reason,
+                                         response.headers, io.BytesIO(body))
+        yield response
+    finally:
+        if response.length == 0:
+            # Bodiless responses (304, 204, empty files) only count as
+            # complete once read, which keeps the socket for reuse
+            response.read()
+        if not response.isclosed():
+            # Unread body bytes would corrupt the next response on this socket
+            _drop_connection(host)
+
+
 def fetch_json(url: str, token: Optional[str] = None, verbose: bool = False) -> dict:
     """Fetch JSON from URL with optional auth token."""
     if verbose:
@@ -95,15 +281,13 @@ def fetch_json(url: str, token: Optional[str] = None, verbose: bool = False) ->
     if token:
         headers["Authorization"] = f"token {token}"
     
-    request = urllib.request.Request(url, headers=headers)
-    
     try:
-        with urllib.request.urlopen(request, timeout=30) as response:
+        with open_url(url, headers) as response:
             return json.loads(response.read().decode('utf-8'))
     except urllib.error.HTTPError as e:
         if e.code == 404:
             raise RuntimeError(f"Not found: {url}. Check URL or use --token for private repos.")
-        elif e.code == 403:
+        elif e.code in (403, 429):
             raise RuntimeError(f"Rate limited or forbidden. Use --token for higher limits.")
         else:
             raise RuntimeError(f"HTTP {e.code}: {e.reason}")
@@ -111,26 +295,271 @@ def fetch_json(url: str, token: Optional[str] = None, verbose: bool = False) ->
         raise RuntimeError(f"Network error: {e.reason}")
 
 
-def fetch_file(url: str, dest_path: Path, token: Optional[str] = None, verbose: bool = False) -> None:
-    """Download a file from URL to destination path."""
+def default_cache_dir() -> Path:
+    """Return the per-user download cache directory (honours XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "universal-skill-manager"
+
+
+# ioctl request for a copy-on-write clone, from <linux/fs.h>
+_FICLONE = 0x40049409
+
+
+def clone_file(src: Path, dest: Path) -> bool:
+    """
+    Make dest a copy-on-write clone of src (reflink) where the filesystem
+    supports it (Btrfs, XFS, ...), so no file data is copied.
+
+    Returns False, leaving dest absent, if cloning isn't possible here.
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        with open(src, 'rb') as s, open(dest, 'wb') as d:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        return True
+    except OSError:
+        try:
+            os.unlink(dest)
+        except OSError:
+            pass
+        return False
+
+
+class DownloadCache:
+    """
+    Conditional-GET cache for raw file downloads.
+
+    etags.json maps each raw URL to the (ETag, sha256) of its last download, and
+    bodies are stored content-addressed under objects/<sha256>. A re-download
+    sends If-None-Match and, on 304, copies the cached body instead. Cache
+    problems never fail an install; they just mean a full download.
+
+    The cache is private to the user (the index lists private repo URLs
+    fetched with --token) and bounded by DOWNLOAD_CACHE_MAX_BYTES.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.objects_dir = cache_dir / "objects"
+        self.index_path = cache_dir / "etags.json"
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._dirs_made = False
+        try:
+            etags = json.loads(self.index_path.read_text(encoding='utf-8'))
+            self.etags = etags if isinstance(etags, dict) else {}
+        except (OSError, ValueError):
+            self.etags = {}
+
+    def lookup(self, url: str) -> Optional[tuple]:
+        """Return (etag, sha256) for a cached URL whose body is still on disk."""
+        entry = self.etags.get(url)
+        if not isinstance(entry, list) or len(entry) != 2:
+            return None
+        if not (self.objects_dir / entry[1]).is_file():
+            return None
+        return entry[0], entry[1]
+
+    def restore(self, sha256: str, dest_path: Path) -> bool:
+        """Copy a cached body to dest_path; False if it is missing or corrupt."""
+        obj = self.objects_dir / sha256
+        hasher = hashlib.sha256()
+        if clone_file(obj, dest_path):
+            # Shares the cached blocks; only read back to verify
+            try:
+                with open(dest_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+                        hasher.update(chunk)
+            except OSError:
+                return False
+        else:
+            try:
+                with open(obj, 'rb') as src, open(dest_path, 'wb') as dst:
+                    for chunk in iter(lambda: src.read(DOWNLOAD_CHUNK_SIZE), b''):
+                        hasher.update(chunk)
+                        dst.write(chunk)
+            except OSError:
+                return False
+        if hasher.hexdigest() != sha256:
+            return False
+        try:
+            os.utime(obj)  # Mark as recently used for eviction
+        except OSError:
+            pass
+        return True
+
+    def store(self, url: str, etag: str, sha256: str, file_path: Path) -> None:
+        """Record a fresh download and keep a copy of its body."""
+        try:
+            self._make_dirs()
+            obj = self.objects_dir / sha256
+            if not obj.exists():
+                tmp = obj.with_name(f"{sha256}.{threading.get_ident()}.tmp")
+                if not clone_file(file_path, tmp):
+                    shutil.copyfile(file_path, tmp)
+                os.replace(tmp, obj)
+        except OSError:
+            return
+        with self._lock:
+            self.etags[url] = [etag, sha256]
+            self._dirty = True
+
+    def forget(self, url: str, sha256: str) -> None:
+        """Drop a URL's entry and its (unusable) cached body."""
+        try:
+            (self.objects_dir / sha256).unlink()
+        except OSError:
+            pass
+        with self._lock:
+            if self.etags.pop(url, None) is not None:
+                self._dirty = True
+
+    def _make_dirs(self) -> None:
+        """Create the cache directories, accessible to this user only."""
+        if self._dirs_made:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+        os.chmod(self.cache_dir, 0o700)  # Also tightens caches made by older versions
+        self.objects_dir.mkdir(exist_ok=True, mode=0o700)
+        self._dirs_made = True
+
+    def _evict(self) -> None:
+        """Delete least recently used bodies until the cache fits its size bound."""
+        try:
+            with os.scandir(self.objects_dir) as it:
+                entries = [(e.stat().st_mtime_ns, e.stat().st_size, e.name)
+                           for e in it if e.is_file()]
+        except OSError:
+            return
+        total = sum(size for _, size, _ in entries)
+        evicted = set()
+        for _mtime, size, name in sorted(entries):
+            if total <= DOWNLOAD_CACHE_MAX_BYTES:
+                break
+            try:
+                (self.objects_dir / name).unlink()
+            except OSError:
+                continue
+            total -= size
+            evicted.add(name)
+        if evicted:
+            with self._lock:
+                self.etags = {
+                    url: entry for url, entry in self.etags.items()
+                    if not (isinstance(entry, list) and entry and entry[-1] in evicted)
+                }
+                self._dirty = True
+
+    def save(self) -> None:
+        """Evict old bodies, then write the ETag index back to disk if it changed."""
+        if not self._dirty:
+            return
+        self._evict()
+        try:
+            self._make_dirs()
+            tmp = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(self.etags))
+            os.replace(tmp, self.index_path)
+            self._dirty = False
+        except OSError:
+            pass
+
+
+def git_blob_sha(size: int):
+    """Return a SHA-1 hasher primed with git's blob header for `size` bytes."""
+    return hashlib.sha1(f"blob {size}\0".encode())
+
+
+def fetch_file(url: str, dest_path: Path, token: Optional[str] = None, verbose: bool = False,
+               cache: Optional[DownloadCache] = None, blob_sha: Optional[str] = None,
+               blob_size: Optional[int] = None) -> None:
+    """
+    Download a file from URL to destination path (parent directory must exist).
+
+    When the file's git blob SHA and size are known from the listing, the
+    downloaded bytes are hashed the way git does and compared, retrying once
+    before giving up, so corruption is caught without another API call.
+    """
+    verify = blob_sha is not None and blob_size is not None
+
+    for attempt in range(2):
+        result = _download_once(url, dest_path, token, verbose, cache,
+                                blob_size if verify else None)
+        if result is None:
+            return  # Restored from cache, already verified by content hash
+        etag, sha256, git_sha = result
+        if not verify or git_sha == blob_sha:
+            if cache is not None and etag:
+                cache.store(url, etag, sha256, dest_path)
+            return
+        if verbose:
+            print(f"  Checksum mismatch, retrying: {url}")
+
+    raise RuntimeError(f"Checksum mismatch downloading {url}: expected git blob {blob_sha}")
+
+
+def _download_once(url: str, dest_path: Path, token: Optional[str], verbose: bool,
+                   cache: Optional[DownloadCache], blob_size: Optional[int]) -> Optional[tuple]:
+    """
+    Fetch url into dest_path once.
+
+    Returns None if an unchanged cached copy was restored, else
+    (etag, sha256, git_blob_sha) of the downloaded body (git_blob_sha is None
+    when blob_size is not given).
+    """
     if verbose:
         print(f"  Downloading: {url}")
     
     headers = {}
     if token:
         headers["Authorization"] = f"token {token}"
-    
-    request = urllib.request.Request(url, headers=headers)
+
+    cached = cache.lookup(url) if cache is not None else None
+    if cached:
+        headers["If-None-Match"] = cached[0]
     
     try:
-        with urllib.request.urlopen(request, timeout=30) as response:
-            content = response.read()
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            dest_path.write_bytes(content)
+        with open_url(url, headers) as response:
+            if response.status == 304 and cached:
+                not_modified = True
+            else:
+                not_modified = False
+                hasher = hashlib.sha256()
+                git_hasher = git_blob_sha(blob_size) if blob_size is not None else None
+                # Stream to disk so memory stays bounded regardless of file size
+                with open(dest_path, 'wb') as f:
+                    for chunk in iter(lambda: response.read(DOWNLOAD_CHUNK_SIZE), b''):
+                        hasher.update(chunk)
+                        if git_hasher is not None:
+                            git_hasher.update(chunk)
+                        f.write(chunk)
+                etag = response.headers.get("ETag")
     except urllib.error.HTTPError as e:
-        raise RuntimeError(f"Failed to download {url}: HTTP {e.code}")
+        if e.code == 304 and cached:  # urllib (proxy path) reports 304 as an error
+            not_modified = True
+        else:
+            raise RuntimeError(f"Failed to download {url}: HTTP {e.code}")
     except urllib.error.URLError as e:
         raise RuntimeError(f"Network error downloading {url}: {e.reason}")
+    except http.client.HTTPException as e:
+        raise RuntimeError(f"Network error downloading {url}: {e!r}")
+    except OSError as e:  # Socket timeouts and resets mid-body, or a failed write
+        raise RuntimeError(f"Error downloading {url}: {e}")
+
+    if not_modified:
+        if cache.restore(cached[1], dest_path):
+            if verbose:
+                print(f"  Unchanged, using cached copy: {url}")
+            return None
+        # Cached body vanished or was corrupted: drop it and download in full
+        cache.forget(url, cached[1])
+        return _download_once(url, dest_path, token, verbose, cache, blob_size)
+
+    git_sha = git_hasher.hexdigest() if git_hasher is not None else None
+    return etag, hasher.hexdigest(), git_sha
 
 
 def list_directory_contents(owner: str, repo: str, branch: str, path: str, 
@@ -145,47 +574,159 @@ def list_directory_contents(owner: str, repo: str, branch: str, path: str,
     return contents
 
 
-def download_directory(owner: str, repo: str, branch: str, path: str, 
-                       dest_dir: Path, token: Optional[str] = None, 
-                       verbose: bool = False, current_depth: int = 0, 
-                       max_depth: int = 5) -> list:
+def fetch_tree(owner: str, repo: str, branch: str, token: Optional[str] = None,
+               verbose: bool = False) -> Optional[list]:
+    """
+    Fetch the whole repository tree in a single Git Trees API call.
+
+    Returns the list of tree entries (each with path, type, sha, size), or
+    None if GitHub truncated the response and the caller must fall back to
+    per-directory listing.
+    """
+    data = fetch_json(to_tree_url(owner, repo, branch), token, verbose)
+
+    if data.get("truncated"):
+        if verbose:
+            print("  Tree listing truncated, falling back to per-directory listing")
+        return None
+
+    return data.get("tree", [])
+
+
+def list_directory_files(owner: str, repo: str, branch: str, path: str,
+                         token: Optional[str] = None, verbose: bool = False,
+                         max_depth: int = 5) -> list:
+    """
+    List files under a GitHub directory via the contents API, one call per
+    directory, walking subdirectories breadth-first.
+    Returns list of (raw_url, relative_path, blob_sha, size) tuples.
+    """
+    files = []
+    queue = deque([(path, "", 0)])
+    warned = False
+
+    while queue:
+        dir_path, rel_dir, depth = queue.popleft()
+        if depth > max_depth:
+            if not warned:
+                print(f"  Warning: Max depth {max_depth} reached, skipping deeper directories")
+                warned = True
+            continue
+
+        for item in list_directory_contents(owner, repo, branch, dir_path, token, verbose):
+            item_name = item["name"]
+            rel_path = f"{rel_dir}/{item_name}" if rel_dir else item_name
+
+            if item["type"] == "file":
+                raw_url = to_raw_url(owner, repo, branch, dir_path, item_name)
+                files.append((raw_url, rel_path, item.get("sha"), item.get("size")))
+
+            elif item["type"] == "dir":
+                sub_path = f"{dir_path}/{item_name}" if dir_path else item_name
+                queue.append((sub_path, rel_path, depth + 1))
+
+    return files
+
+
+def list_tree_files(owner: str, repo: str, branch: str, path: str,
+                    tree: list, max_depth: int = 5) -> list:
+    """
+    Select the files under `path` from a pre-fetched Git tree.
+    Returns list of (raw_url, relative_path, blob_sha, size) tuples.
+    """
+    prefix = f"{path}/" if path else ""
+    files = []
+    depth_warned = False
+
+    for entry in tree:
+        entry_path = entry["path"]
+        # Only regular files; symlinks (mode 120000) are skipped like the contents API does
+        if entry["type"] != "blob" or entry.get("mode") == "120000":
+            continue
+        if not entry_path.startswith(prefix):
+            continue
+
+        rel_path = entry_path[len(prefix):]
+        if rel_path.count('/') > max_depth:
+            if not depth_warned:
+                print(f"  Warning: Max depth {max_depth} reached, skipping deeper directories")
+                depth_warned = True
+            continue
+
+        dir_path, _, file_name = entry_path.rpartition('/')
+        raw_url = to_raw_url(owner, repo, branch, dir_path, file_name)
+        files.append((raw_url, rel_path, entry.get("sha"), entry.get("size")))
+
+    return files
+
+
+def download_files(files: list, dest_dir: Path, token: Optional[str] = None,
+                   verbose: bool = False, cache: Optional[DownloadCache] = None) -> list:
     """
-    Recursively download directory contents from GitHub.
+    Download (raw_url, relative_path, blob_sha, size) entries into dest_dir
+    concurrently, verifying each against its git blob SHA when known.
+
+    Stops scheduling new downloads after the first failure and raises a
+    RuntimeError once in-flight downloads have finished.
     Returns list of downloaded file paths (relative to dest_dir).
     """
-    if current_depth > max_depth:
-        print(f"  Warning: Max depth {max_depth} reached, skipping deeper directories")
-        return []
-    
     downloaded = []
-    contents = list_directory_contents(owner, repo, branch, path, token, verbose)
-    
-    for item in contents:
-        item_name = item["name"]
-        item_type = item["type"]
-        
-        if item_type == "file":
-            # Download via raw URL
-            raw_url = to_raw_url(owner, repo, branch, path, item_name)
-            dest_path = dest_dir / item_name
-            fetch_file(raw_url, dest_path, token, verbose)
-            downloaded.append(item_name)
-            print(f"  ✓ {item_name}")
-        
-        elif item_type == "dir":
-            # Recursively download subdirectory
-            subdir = dest_dir / item_name
-            subdir.mkdir(parents=True, exist_ok=True)
-            sub_path = f"{path}/{item_name}"
-            sub_files = download_directory(
-                owner, repo, branch, sub_path, subdir, 
-                token, verbose, current_depth + 1, max_depth
-            )
-            downloaded.extend([f"{item_name}/{f}" for f in sub_files])
-    
+    errors = []
+
+    # Create each directory once up front rather than once per file
+    for parent in sorted({(dest_dir / f[1]).parent for f in files}):
+        parent.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        futures = [
+            executor.submit(fetch_file, raw_url, dest_dir / rel_path, token, verbose,
+                            cache, blob_sha, size)
+            for raw_url, rel_path, blob_sha, size in files
+        ]
+        for (_, rel_path, _, _), future in zip(files, futures):
+            if future.cancelled():
+                continue
+            try:
+                future.result()
+            except RuntimeError as e:
+                if not errors:
+                    for pending in futures:
+                        pending.cancel()
+                errors.append(str(e))
+                continue
+            downloaded.append(rel_path)
+            print(f"  ✓ {rel_path}")
+
+    if errors:
+        if len(errors) > 1:
+            raise RuntimeError(f"{errors[0]} (and {len(errors) - 1} more failed downloads)")
+        raise RuntimeError(errors[0])
+
     return downloaded
 
 
+def download_directory(owner: str, repo: str, branch: str, path: str,
+                       dest_dir: Path, token: Optional[str] = None,
+                       verbose: bool = False, max_depth: int = 5,
+                       tree: Optional[list] = None,
+                       cache: Optional[DownloadCache] = None) -> list:
+    """
+    Download directory contents from GitHub.
+
+    If a pre-fetched tree (see fetch_tree) is given, files are selected from it
+    locally with no further API calls. Otherwise the directory is walked
+    recursively via the contents API. Files are then downloaded in parallel.
+    Returns list of downloaded file paths (relative to dest_dir).
+    """
+    if tree is not None:
+        files = list_tree_files(owner, repo, branch, path, tree, max_depth)
+    else:
+        files = list_directory_files(owner, repo, branch, path, token, verbose,
+                                     max_depth=max_depth)
+
+    return download_files(files, dest_dir, token, verbose, cache)
+
+
 # =============================================================================
 # Validation
 # =============================================================================
@@ -195,14 +736,28 @@ def parse_simple_yaml(yaml_str: str) -> dict:
     Parse simple key: value YAML (no nested objects, no lists).
     Sufficient for SKILL.md frontmatter.
     """
+    return parse_simple_yaml_keys(yaml_str)
+
+
+def parse_simple_yaml_keys(yaml_str: str, required: Optional[set] = None) -> dict:
+    """
+    Parse simple key: value YAML like parse_simple_yaml, but stop as soon as
+    every key in `required` has been seen (None parses the whole document).
+    """
     result = {}
-    for line in yaml_str.strip().split('\n'):
+    missing = set(required) if required else None
+    for line in io.StringIO(yaml_str):
         line = line.strip()
         if not line or line.startswith('#'):
             continue
         if ':' in line:
             key, value = line.split(':', 1)
-            result[key.strip()] = value.strip().strip('"').strip("'")
+            key = key.strip()
+            result[key] = value.strip().strip('"').strip("'")
+            if missing is not None:
+                missing.discard(key)
+                if not missing:
+                    break
     return result
 
 
@@ -219,12 +774,12 @@ def validate_skill_md(file_path: Path) -> tuple[bool, str]:
     if not content.startswith('---'):
         return False, "Missing YAML frontmatter (must start with ---)"
     
-    parts = content.split('---', 2)
-    if len(parts) < 3:
+    end = content.find('---', 3)
+    if end == -1:
         return False, "Invalid frontmatter (missing closing ---)"
     
     try:
-        frontmatter = parse_simple_yaml(parts[1])
+        frontmatter = parse_simple_yaml_keys(content[3:end], {'name', 'description'})
     except Exception as e:
         return False, f"Invalid YAML: {e}"
     
@@ -237,12 +792,15 @@ def validate_skill_md(file_path: Path) -> tuple[bool, str]:
 
 
 def validate_python(file_path: Path) -> tuple[bool, str]:
-    """Validate Python syntax using ast.parse()."""
+    """Validate Python syntax by compiling to an AST."""
     try:
-        content = file_path.read_text(encoding='utf-8')
-        ast.parse(content)
+        # Bytes go straight to the compiler, which honours PEP 263 coding cookies
+        compile(file_path.read_bytes(), str(file_path), 'exec',
+                flags=ast.PyCF_ONLY_AST, dont_inherit=True)
         return True, ""
     except SyntaxError as e:
+        if e.lineno is None:
+            return False, f"Python syntax error: {e.msg}"
         return False, f"Python syntax error at line {e.lineno}: {e.msg}"
     except Exception as e:
         return False, f"Cannot parse Python: {e}"
@@ -267,11 +825,19 @@ def validate_shell(file_path: Path) -> tuple[bool, str]:
         return False, f"Cannot validate shell script: {e}"
 
 
+# Syntax-only JSON decoder: objects are discarded as soon as they are parsed,
+# so validating a large file doesn't build (and then throw away) the whole tree
+_JSON_SYNTAX_DECODER = json.JSONDecoder(object_pairs_hook=lambda pairs: None)
+
+
 def validate_json(file_path: Path) -> tuple[bool, str]:
     """Validate JSON syntax."""
     try:
         content = file_path.read_text(encoding='utf-8')
-        json.loads(content)
+        if content.startswith('\ufeff'):
+            # Same rejection json.loads applies
+            raise json.JSONDecodeError("Unexpected UTF-8 BOM (decode using utf-8-sig)", content, 0)
+        _JSON_SYNTAX_DECODER.decode(content)
         return True, ""
     except json.JSONDecodeError as e:
         return False, f"Invalid JSON at line {e.lineno}: {e.msg}"
@@ -290,27 +856,29 @@ def validate_yaml(file_path: Path) -> tuple[bool, str]:
         return False, f"Invalid YAML: {e}"
 
 
+def _no_validation(file_path: Path) -> tuple[bool, str]:
+    """No validation for other file types."""
+    return True, ""
+
+
+# Validator by lowercased file extension
+_VALIDATORS = {
+    '.py': validate_python,
+    '.sh': validate_shell,
+    '.json': validate_json,
+    '.yaml': validate_yaml,
+    '.yml': validate_yaml,
+}
+
+
 def validate_file(file_path: Path, verbose: bool = False) -> tuple[bool, str]:
     """
     Validate a file based on its extension.
     Returns (success, error_message).
     """
-    name = file_path.name.lower()
-    suffix = file_path.suffix.lower()
-    
-    if name == 'skill.md':
+    if file_path.name.lower() == 'skill.md':
         return validate_skill_md(file_path)
-    elif suffix == '.py':
-        return validate_python(file_path)
-    elif suffix == '.sh':
-        return validate_shell(file_path)
-    elif suffix == '.json':
-        return validate_json(file_path)
-    elif suffix in ('.yaml', '.yml'):
-        return validate_yaml(file_path)
-    else:
-        # No validation for other file types
-        return True, ""
+    return _VALIDATORS.get(file_path.suffix.lower(), _no_validation)(file_path)
 
 
 def validate_all_files(directory: Path, verbose: bool = False) -> tuple[bool, list]:
@@ -326,12 +894,29 @@ def validate_all_files(directory: Path, verbose: bool = False) -> tuple[bool, li
         errors.append("SKILL.md not found in skill directory")
         return False, errors
     
-    # Validate all files
-    for file_path in directory.rglob('*'):
-        if file_path.is_file():
-            valid, error = validate_file(file_path, verbose)
-            if not valid:
-                errors.append(f"{file_path.name}: {error}")
+    # os.walk classifies entries from the directory listing, no stat per entry
+    files = [
+        Path(root) / name
+        for root, _dirs, names in os.walk(directory)
+        for name in names
+    ]
+
+    # Validate all files (in worker processes for larger skills, where
+    # ast.parse and bash -n dominate and process startup is worth paying)
+    results = None
+    if len(files) >= PARALLEL_VALIDATION_MIN_FILES:
+        try:
+            workers = min(os.cpu_count() or 1, len(files))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(validate_file, files, repeat(verbose)))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            results = None  # No usable process pool here; validate serially
+    if results is None:
+        results = [validate_file(file_path, verbose) for file_path in files]
+
+    for file_path, (valid, error) in zip(files, results):
+        if not valid:
+            errors.append(f"{file_path.name}: {error}")
     
     return len(errors) == 0, errors
 
@@ -354,11 +939,14 @@ def check_root_skills_directory_safety(dest: Path, force: bool) -> None:
     if has_skill_md:
         return  # This IS a skill, safe to update
     
-    # Check for subdirectories containing SKILL.md (installed skills)
-    installed_skills = [
-        d.name for d in dest.iterdir() 
-        if d.is_dir() and (d / "SKILL.md").exists()
-    ]
+    # Check for subdirectories containing SKILL.md (installed skills).
+    # scandir's entry types come from the directory read, so only the
+    # SKILL.md probe costs a stat per subdirectory.
+    with os.scandir(dest) as entries:
+        installed_skills = [
+            entry.name for entry in entries
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, "SKILL.md"))
+        ]
     
     if installed_skills:
         # DANGER: This is a root skills directory!
@@ -376,18 +964,90 @@ def check_root_skills_directory_safety(dest: Path, force: bool) -> None:
         sys.exit(4)
 
 
+# file_hash results keyed by (path, mtime_ns, size), kept for the whole run
+_hash_cache: dict = {}
+
+
 def file_hash(file_path: Path) -> str:
-    """Calculate MD5 hash of a file for comparison."""
-    hasher = hashlib.md5()
+    """Calculate a BLAKE2b hash of a file for change detection (not security)."""
+    st = os.stat(file_path)
+    key = (str(file_path), st.st_mtime_ns, st.st_size)
+    digest = _hash_cache.get(key)
+    if digest is not None:
+        return digest
+
     with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+: read loop runs in C
+            hasher = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16))
+        else:
+            hasher = hashlib.blake2b(digest_size=16)
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+    digest = _hash_cache[key] = hasher.hexdigest()
+    return digest
+
+
+# Written into each installed skill: (mtime_ns, size, hash) per file, so the
+# next update's diff can skip hashing files that haven't changed since
+SKILL_MANIFEST_NAME = ".skill-manifest.json"
+
+
+def list_skill_files(base: Path) -> dict:
+    """
+    Map each file under base (relative path) to (path, size, mtime_ns).
+    The skill manifest itself is left out.
+    """
+    files = {}
+    stack = [(str(base), "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                rel_path = rel_dir + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel_path + os.sep))
+                elif entry.is_file() and rel_path != SKILL_MANIFEST_NAME:
+                    st = entry.stat()
+                    files[rel_path] = (entry.path, st.st_size, st.st_mtime_ns)
+    return files
+
+
+def read_skill_manifest(skill_dir: Path) -> dict:
+    """Return the manifest's {rel_path: [mtime_ns, size, hash]}, or {} if unusable."""
+    try:
+        manifest = json.loads((skill_dir / SKILL_MANIFEST_NAME).read_text(encoding='utf-8'))
+        files = manifest["files"] if manifest.get("version") == 1 else {}
+        return files if isinstance(files, dict) else {}
+    except (OSError, ValueError, AttributeError, KeyError):
+        return {}
+
+
+def write_skill_manifest(skill_dir: Path) -> None:
+    """
+    Record every file's mtime, size and hash in skill_dir's manifest.
+    Failures are ignored: the manifest only speeds up the next update.
+    """
+    try:
+        files = list_skill_files(skill_dir)
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+            hashes = pool.map(file_hash, (path for path, _size, _mtime in files.values()))
+            manifest = {
+                rel_path: [mtime_ns, size, digest]
+                for (rel_path, (_path, size, mtime_ns)), digest in zip(files.items(), hashes)
+            }
+        (skill_dir / SKILL_MANIFEST_NAME).write_text(
+            json.dumps({"version": 1, "files": manifest}), encoding='utf-8'
+        )
+    except OSError:
+        pass
 
 
 def compare_skill_directories(new_dir: Path, existing_dir: Path) -> dict:
     """
     Compare two skill directories and return differences.
+
+    Hashes recorded in existing_dir's manifest are reused for files whose
+    mtime and size still match.
     
     Returns:
         {
@@ -397,17 +1057,9 @@ def compare_skill_directories(new_dir: Path, existing_dir: Path) -> dict:
             "modified": [list of changed files],
         }
     """
-    def get_relative_files(base: Path) -> dict:
-        """Get all files relative to base with their hashes."""
-        files = {}
-        for file_path in base.rglob('*'):
-            if file_path.is_file():
-                rel_path = str(file_path.relative_to(base))
-                files[rel_path] = file_hash(file_path)
-        return files
-    
-    new_files = get_relative_files(new_dir)
-    existing_files = get_relative_files(existing_dir)
+    new_files = list_skill_files(new_dir)
+    existing_files = list_skill_files(existing_dir)
+    manifest = read_skill_manifest(existing_dir)
     
     new_set = set(new_files.keys())
     existing_set = set(existing_files.keys())
@@ -415,9 +1067,36 @@ def compare_skill_directories(new_dir: Path, existing_dir: Path) -> dict:
     added = sorted(new_set - existing_set)
     removed = sorted(existing_set - new_set)
     
-    # Check for modified files (same name, different hash)
-    common = new_set & existing_set
-    modified = sorted([f for f in common if new_files[f] != existing_files[f]])
+    # Check for modified files. A size difference settles it; only files of
+    # equal size need hashing, on a shared pool.
+    modified = []
+    same_size = []
+    for f in new_set & existing_set:
+        new_path, new_size, _new_mtime = new_files[f]
+        existing_path, existing_size, existing_mtime = existing_files[f]
+        if new_size != existing_size:
+            modified.append(f)
+        else:
+            recorded = manifest.get(f)
+            if (isinstance(recorded, list) and len(recorded) == 3
+                    and recorded[:2] == [existing_mtime, existing_size]):
+                existing_hash = recorded[2]
+            else:
+                existing_hash = None
+            same_size.append((f, new_path, existing_path, existing_hash))
+
+    if same_size:
+        # Each pair is compared as soon as both digests are ready; no
+        # per-tree table of hashes is kept
+        def differs(item: tuple) -> bool:
+            _f, new_path, existing_path, existing_hash = item
+            return file_hash(new_path) != (existing_hash or file_hash(existing_path))
+
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+            modified.extend(
+                item[0] for item, changed in zip(same_size, pool.map(differs, same_size)) if changed
+            )
+    modified.sort()
     
     identical = len(added) == 0 and len(removed) == 0 and len(modified) == 0
     
@@ -477,16 +1156,132 @@ def display_skill_diff(diff: dict, dest: Path, force: bool) -> bool:
 # Installation
 # =============================================================================
 
-def install_skill(temp_dir: Path, dest: Path) -> None:
-    """Copy validated skill from temp to destination."""
-    if dest.exists():
-        shutil.rmtree(dest)
-    
-    # Ensure parent exists
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Copy from temp to destination
-    shutil.copytree(str(temp_dir), str(dest))
+def fsync_path(path: Path, is_dir: bool = False) -> None:
+    """Flush a file (or directory entry table) to stable storage."""
+    if is_dir:
+        if os.name == 'nt' or not hasattr(os, 'O_DIRECTORY'):
+            return  # Directories can't be opened for fsync on Windows
+        flags = os.O_RDONLY | os.O_DIRECTORY
+    elif os.name == 'nt':
+        # fsync maps to FlushFileBuffers there, which needs a writable handle
+        flags = os.O_RDWR | getattr(os, 'O_BINARY', 0)
+    else:
+        flags = os.O_RDONLY
+
+    fd = os.open(path, flags)
+    try:
+        os.fsync(fd)
+        # macOS fsync() doesn't flush the drive's write cache; F_FULLFSYNC does
+        if fcntl is not None and hasattr(fcntl, 'F_FULLFSYNC'):
+            try:
+                fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+            except OSError:
+                pass  # Not supported by this filesystem
+    except OSError:
+        if not is_dir:
+            raise
+        # Some filesystems reject fsync on directories; nothing more we can do
+    finally:
+        os.close(fd)
+
+
+def fsync_tree(directory: Path) -> None:
+    """Flush every file and directory under directory to stable storage."""
+    for root, _dirs, names in os.walk(directory):
+        for name in names:
+            fsync_path(Path(root) / name)
+        fsync_path(Path(root), is_dir=True)
+
+
+def backup_existing(dest: Path, backup: Path) -> Optional[Path]:
+    """
+    Move an existing skill at dest aside to backup with a single rename.
+
+    backup must be a sibling on the same filesystem. Returns the backup path,
+    or None if there was nothing to back up.
+    """
+    if not dest.exists():
+        return None
+    if backup.exists():
+        shutil.rmtree(backup)
+    os.rename(dest, backup)
+    return backup
+
+
+def restore_backup(backup: Optional[Path], dest: Path) -> None:
+    """Put a skill moved aside by backup_existing() back in place."""
+    if backup is not None:
+        os.rename(backup, dest)
+
+
+# renameat2(2) flag and "current directory" fd, from <linux/fs.h> / <fcntl.h>
+_RENAME_EXCHANGE = 2
+_AT_FDCWD = -100
+_renameat2 = None
+
+
+def exchange_paths(a: Path, b: Path) -> bool:
+    """
+    Atomically swap two paths with Linux renameat2(RENAME_EXCHANGE).
+
+    Returns False when the platform, libc, or filesystem doesn't support it,
+    so the caller can fall back to two renames.
+    """
+    global _renameat2
+    if not sys.platform.startswith("linux"):
+        return False
+    if _renameat2 is None:
+        try:
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            _renameat2 = libc.renameat2
+            _renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p,
+                                   ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+        except (ImportError, OSError, AttributeError):
+            _renameat2 = False
+    if not _renameat2:
+        return False
+
+    if _renameat2(_AT_FDCWD, os.fsencode(a), _AT_FDCWD, os.fsencode(b), _RENAME_EXCHANGE) == 0:
+        return True
+    import ctypes
+    err = ctypes.get_errno()
+    if err in (errno.EINVAL, errno.ENOSYS, errno.ENOTSUP):
+        return False
+    raise OSError(err, os.strerror(err), str(a), None, str(b))
+
+
+def install_skill(temp_dir: Path, dest: Path, durable: bool = True) -> None:
+    """
+    Move validated skill from temp to destination.
+
+    temp_dir must be on the same filesystem as dest (main() stages it inside
+    dest.parent) so that each step is a single atomic rename. On Linux an
+    existing skill is swapped out in one renameat2(RENAME_EXCHANGE) call;
+    elsewhere it is moved aside first and restored if the final rename fails.
+
+    With durable=True the files are fsynced before the rename and the parent
+    directory after it, so a crash can't leave empty or missing files.
+    """
+    if durable:
+        fsync_tree(temp_dir)
+
+    if dest.exists() and exchange_paths(temp_dir, dest):
+        # temp_dir now holds the previous version
+        backup = temp_dir
+    else:
+        backup = backup_existing(dest, temp_dir.with_name(temp_dir.name + ".previous"))
+        try:
+            os.rename(temp_dir, dest)
+        except OSError:
+            restore_backup(backup, dest)
+            raise
+
+    if durable:
+        fsync_path(dest.parent, is_dir=True)
+
+    if backup is not None:
+        shutil.rmtree(backup, ignore_errors=True)
 
 
 # =============================================================================
@@ -502,19 +1297,27 @@ def find_scanner_script() -> Optional[Path]:
     return None
 
 
-def run_security_scan(skill_dir: Path, force: bool = False) -> bool:
+@lru_cache(maxsize=None)
+def load_scanner(scanner: Path):
     """
-    Run security scan on a skill directory before installation.
-
-    Returns True if installation should proceed, False to abort.
+    Import SkillScanner from scan_skill.py, or return None if it can't be loaded.
+    Cached, so its pattern tables are compiled once however many skills are scanned.
     """
-    scanner = find_scanner_script()
-    if scanner is None:
-        print("  Warning: Security scanner (scan_skill.py) not found, skipping scan")
-        return True
+    try:
+        spec = importlib.util.spec_from_file_location("scan_skill", scanner)
+        module = importlib.util.module_from_spec(spec)
+        # Registered first so the scanner's worker processes can find its
+        # functions by module name when they're pickled
+        sys.modules["scan_skill"] = module
+        spec.loader.exec_module(module)
+        return module.SkillScanner
+    except Exception:
+        sys.modules.pop("scan_skill", None)
+        return None
 
-    print("\nRunning security scan...")
 
+def run_scanner_subprocess(scanner: Path, skill_dir: Path) -> Optional[dict]:
+    """Run scan_skill.py in a separate interpreter and return its report, or None."""
     try:
         result = subprocess.run(
             [sys.executable, str(scanner), str(skill_dir)],
@@ -524,18 +1327,47 @@ def run_security_scan(skill_dir: Path, force: bool = False) -> bool:
         )
     except subprocess.TimeoutExpired:
         print("  Warning: Security scan timed out, skipping")
-        return True
+        return None
     except Exception as e:
         print(f"  Warning: Security scan failed to run: {e}")
-        return True
+        return None
 
     # Parse JSON output from scanner
     try:
-        report = json.loads(result.stdout)
+        return json.loads(result.stdout)
     except json.JSONDecodeError:
         print("  Warning: Could not parse security scan results, skipping")
+        return None
+
+
+def run_security_scan(skill_dir: Path, force: bool = False) -> bool:
+    """
+    Run security scan on a skill directory before installation.
+
+    The scanner is imported and run in-process; it only runs as a
+    subprocess if the import fails.
+
+    Returns True if installation should proceed, False to abort.
+    """
+    scanner = find_scanner_script()
+    if scanner is None:
+        print("  Warning: Security scanner (scan_skill.py) not found, skipping scan")
         return True
 
+    print("\nRunning security scan...")
+
+    report = None
+    scanner_class = load_scanner(scanner)
+    if scanner_class is not None:
+        try:
+            report = scanner_class().scan_path(str(skill_dir))
+        except Exception:
+            report = None
+    if report is None:
+        report = run_scanner_subprocess(scanner, skill_dir)
+        if report is None:
+            return True
+
     # Extract summary and findings
     summary = report.get("summary", {})
     findings = report.get("findings", [])
@@ -630,6 +1462,15 @@ Examples:
         '--max-depth', type=int, default=5,
         help='Maximum directory depth to recurse (default: 5)'
     )
+    parser.add_argument(
+        '--durable', action=argparse.BooleanOptionalAction, default=True,
+        help='fsync installed files before reporting success (default: on; '
+             'use --no-durable for throwaway installs)'
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='Download every file in full instead of revalidating cached copies'
+    )
     parser.add_argument(
         '--skip-scan', action='store_true',
         help='Skip security scan (not recommended)'
@@ -686,22 +1527,33 @@ Examples:
             sys.exit(1)
         sys.exit(0)
     
-    # Create temp directory for atomic install
-    with tempfile.TemporaryDirectory(prefix="skill_install_") as temp_dir:
+    # Create temp directory for atomic install. It lives next to the destination
+    # (hidden, so AI tools ignore it) so the final move is a same-filesystem rename.
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix=".skill_install_", dir=dest.parent) as temp_dir:
         temp_path = Path(temp_dir) / "skill"
         temp_path.mkdir()
         
         # Step 1: Download all files to temp
         print("\nDownloading skill files...")
+        cache = None if args.no_cache else DownloadCache(default_cache_dir())
         try:
+            tree = fetch_tree(
+                parsed['owner'], parsed['repo'], parsed['branch'],
+                args.token, args.verbose
+            )
             downloaded = download_directory(
                 parsed['owner'], parsed['repo'], parsed['branch'], parsed['path'],
-                temp_path, args.token, args.verbose, max_depth=args.max_depth
+                temp_path, args.token, args.verbose, max_depth=args.max_depth,
+                tree=tree, cache=cache
             )
         except RuntimeError as e:
             print(f"\nError during download: {e}", file=sys.stderr)
             sys.exit(1)
         
+        if cache is not None:
+            cache.save()
+
         if not downloaded:
             print("Error: No files downloaded", file=sys.stderr)
             sys.exit(1)
@@ -741,10 +1593,11 @@ Examples:
                     print("Aborted.")
                     sys.exit(0)
         
-        # Step 4: Install (copy from temp to destination)
+        # Step 4: Install (move from temp to destination)
         print(f"\nInstalling to: {dest}")
         try:
-            install_skill(temp_path, dest)
+            write_skill_manifest(temp_path)
+            install_skill(temp_path, dest, args.durable)
         except Exception as e:
             print(f"\nError during installation: {e}", file=sys.stderr)
             sys.exit(3)
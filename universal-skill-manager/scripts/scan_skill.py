@@ -9,6 +9,7 @@ injection, credential exfiltration, invisible unicode, and other threats.
 Usage:
     python3 scan_skill.py <path>            # Scan a skill directory or file
     python3 scan_skill.py --pretty <path>   # Pretty-print the JSON report
+    python3 scan_skill.py --min-severity warning <path>  # Skip info-level checks
     python3 scan_skill.py --version         # Print version and exit
 
 Exit codes:
@@ -25,19 +26,522 @@ Output:
 """
 
 import argparse
+import bisect
+import codecs
 import json
 import os
 import re
 import sys
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
+from functools import cached_property
+from itertools import accumulate, repeat
+from operator import attrgetter
 from pathlib import Path
 
 VERSION = "1.0.0"
 
+# Below this many files, scanning in-process beats process pool startup
+PARALLEL_SCAN_MIN_FILES = 8
+# Files per worker task, so small files don't each pay a round trip
+SCAN_CHUNK_SIZE = 16
+
+# File types that get pattern checks beyond invisible unicode
+CHECKED_SUFFIXES = (".md", ".py", ".sh", ".bash", ".json", ".yaml", ".yml")
+# Leading bytes checked for a NUL to recognise binary files
+BINARY_SNIFF_SIZE = 4096
+# Read size while decoding the rest of a file that looked binary
+BINARY_DECODE_CHUNK_SIZE = 64 * 1024
+
+# Finding severities, lowest first
+SEVERITIES = ("info", "warning", "critical")
+
+# Invisible/zero-width Unicode codepoint ranges
+INVISIBLE_RANGES = [
+    (0x200B, 0x200F),  # zero-width space, ZWNJ, ZWJ, LRM, RLM
+    (0x2060, 0x2064),  # word joiner, invisible operators/separators
+    (0x2066, 0x2069),  # directional isolates
+    (0x202A, 0x202E),  # bidirectional overrides
+    (0x206A, 0x206F),  # deprecated formatting characters
+    (0xFEFF, 0xFEFF),  # byte order mark
+    (0x00AD, 0x00AD),  # soft hyphen
+    (0x034F, 0x034F),  # combining grapheme joiner
+    (0x061C, 0x061C),  # arabic letter mark
+    (0x115F, 0x1160),  # hangul filler
+    (0x17B4, 0x17B5),  # khmer vowel inherent
+    (0x180E, 0x180E),  # mongolian vowel separator
+    (0xE0000, 0xE007F),  # unicode tag characters
+]
+
+# One character class covering every range, so lines are searched in C
+_INVISIBLE_RE = re.compile(
+    "[" + "".join(f"\\U{start:08X}-\\U{end:08X}" for start, end in INVISIBLE_RANGES) + "]"
+)
+
+# Pattern tables, compiled once at import. Within a check the first pattern
+# that matches a line wins, so order matters.
+
+EXFILTRATION_URL_PATTERNS = [
+    (
+        re.compile(r'!\[.*?\]\(https?://[^)]*[\$\{]', re.IGNORECASE),
+        "Markdown image with variable interpolation — may exfiltrate data via URL",
+    ),
+    (
+        re.compile(r'<img\s[^>]*src\s*=\s*["\']https?://', re.IGNORECASE),
+        "HTML img tag with external URL — may load tracking pixel or exfiltrate data",
+    ),
+    (
+        re.compile(r'!\[.*?\]\(https?://[^)]*\?[^)]*=', re.IGNORECASE),
+        "Markdown image with query parameters — may exfiltrate data via URL parameters",
+    ),
+]
+
+SHELL_PIPE_PATTERN = re.compile(
+    r'(curl|wget)\s+[^|]*\|\s*(bash|sh|zsh|python[23]?|perl|ruby|node)',
+    re.IGNORECASE,
+)
+
+CREDENTIAL_PATH_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'~/\.ssh/',
+    r'~/\.aws/',
+    r'~/\.gnupg/',
+    r'~/\.env\b',
+    r'\.credentials',
+    r'id_rsa',
+    r'id_ed25519',
+    r'id_ecdsa',
+    r'\.pem\b',
+    r'\.key\b',
+    r'/etc/passwd',
+    r'/etc/shadow',
+)]
+
+CREDENTIAL_ENV_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\$\{?GITHUB_TOKEN\}?',
+    r'\$\{?OPENAI_API_KEY\}?',
+    r'\$\{?ANTHROPIC_API_KEY\}?',
+    r'\$\{?AWS_SECRET_ACCESS_KEY\}?',
+    r'\$\{?AWS_ACCESS_KEY_ID\}?',
+    r'\$\{?DATABASE_URL\}?',
+    r'\$\{?DB_PASSWORD\}?',
+    r'\$\{?SECRET_KEY\}?',
+    r'\$\{?PRIVATE_KEY\}?',
+    r'\$\{?API_SECRET\}?',
+    r'\$\{?GOOGLE_API_KEY\}?',
+    r'\$\{?STRIPE_SECRET\}?',
+)]
+
+EXTERNAL_URL_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\bcurl\s+.*https?://',
+    r'\bwget\s+.*https?://',
+    r'\bfetch\s*\(\s*["\']https?://',
+    r'\brequests?\.(get|post|put|delete)\s*\(',
+    r'\bhttp\.(get|post|put|delete)\s*\(',
+    r'\burllib\.request',
+)]
+
+COMMAND_EXECUTION_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\beval\s*\(',
+    r'\bexec\s*\(',
+    r'\bos\.system\s*\(',
+    r'\bsubprocess\.(run|call|Popen|check_output)\s*\(',
+    r'\bsh\s+-c\s+',
+    r'\bbash\s+-c\s+',
+    r'\bRuntime\.exec\s*\(',
+    r'\bos\.popen\s*\(',
+    r'\bcommands\.getoutput\s*\(',
+)]
+
+INSTRUCTION_OVERRIDE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'ignore\s+(all\s+)?previous\s+instructions?',
+    r'disregard\s+(all\s+)?(previous\s+|prior\s+)?instructions?',
+    r'disregard\s+(all\s+)?(previous\s+|prior\s+)?directives?',
+    r'forget\s+(all\s+)?(previous\s+|everything\s+)',
+    r'new\s+instructions?\s+(follow|are|:)',
+    r'override\s+(all\s+)?previous\s+instructions?',
+    r'cancel\s+(all\s+)?prior\s+instructions?',
+    r'your\s+(new|updated)\s+instructions?\s+(are|:)',
+    r'do\s+not\s+follow\s+(your\s+)?(original|previous)',
+)]
+
+ROLE_HIJACKING_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'you\s+are\s+now\s+(?!going|ready|able)',
+    r'act\s+as\s+(if\s+)?(you\s+are|an?\s+)',
+    r'pretend\s+(to\s+be|you\s+are)',
+    r'assume\s+the\s+role\s+of',
+    r'enter\s+developer\s+mode',
+    r'\bDAN\s+mode\b',
+    r'unrestricted\s+mode',
+    r'you\s+have\s+no\s+restrictions',
+    r'enable\s+jailbreak',
+    r'you\s+are\s+no\s+longer\s+bound',
+)]
+
+SAFETY_BYPASS_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'bypass\s+(safety|security|filter|restriction)',
+    r'disable\s+(content\s+)?filter',
+    r'remove\s+(all\s+)?restrictions?',
+    r'ignore\s+safety\s+protocols?',
+    r'without\s+(any\s+)?restrictions?',
+    r'system\s+override',
+    r'no\s+ethical\s+guidelines',
+    r'disregard\s+(any\s+)?filters?',
+    r'turn\s+off\s+(safety|content\s+filter)',
+)]
+
+ENCODED_CONTENT_PATTERNS = [
+    (re.compile(r'[A-Za-z0-9+/]{40,}={0,2}'), "Long base64-encoded string detected"),
+    (re.compile(r'(?:\\x[0-9a-fA-F]{2}){4,}'), "Hex escape sequences detected"),
+    (re.compile(r'(?:\\u[0-9a-fA-F]{4}){3,}'), "Unicode escape sequences detected"),
+    (re.compile(r'(?:&#x?[0-9a-fA-F]+;){3,}'), "HTML entity sequences detected"),
+    (re.compile(r'(?:%[0-9a-fA-F]{2}){6,}'), "URL-encoded sequences detected"),
+]
+
+PROMPT_EXTRACTION_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'reveal\s+(your\s+)?system\s+prompt',
+    r'show\s+(me\s+)?your\s+instructions',
+    r'print\s+(your\s+)?(initial\s+)?prompt',
+    r'output\s+your\s+(configuration|instructions)',
+    r'what\s+(were\s+you|are\s+your)\s+(told|instructions)',
+    r'repeat\s+the\s+(above|previous)\s+text',
+    r'display\s+(your\s+)?(system\s+)?(prompt|instructions)',
+)]
+
+# Case-sensitive exact token patterns
+DELIMITER_TOKEN_PATTERNS = [re.compile(p) for p in (
+    r'<\|system\|>',
+    r'<\|user\|>',
+    r'<\|assistant\|>',
+    r'<\|im_start\|>',
+    r'<\|im_end\|>',
+    r'\[INST\]',
+    r'\[/INST\]',
+    r'<<SYS>>',
+    r'<</SYS>>',
+)]
+
+CROSS_SKILL_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'install\s+(this\s+|the\s+)?skill\s+from\s+https?://',
+    r'download\s+(this\s+|the\s+)?skill\s+from',
+    r'fetch\s+(this\s+|the\s+)?(skill|extension)\s+from',
+    r'add\s+(this\s+)?to\s+~/\.(claude|gemini|cursor|codex|roo)',
+    r'cp\s+.*\s+~/\.(claude|gemini|cursor|codex|roo)/(skills|extensions)',
+    r'git\s+clone\s+.*\s+~/\.(claude|gemini|cursor|codex)',
+)]
+
+
+# A pattern that is nothing but one repeated group, e.g. (?:%[0-9a-f]{2}){6,}
+_REPEATED_GROUP_RE = re.compile(r'\(\?:([^()]*)\)\{([1-9]\d*),\}')
+
+
+def _unroll(pattern):
+    """
+    Rewrite a pattern that is a single repeated group to start with a plain
+    copy of the group: (?:X){n,} becomes X(?:X){n-1,}. Both match the same
+    text, but re only skips ahead to possible first characters when the
+    pattern starts with a literal, not with a repeat.
+    """
+    m = _REPEATED_GROUP_RE.fullmatch(pattern)
+    if not m:
+        return pattern
+    body, count = m.groups()
+    return f"{body}(?:{body}){{{int(count) - 1},}}"
+
+
+def _fuse(regexes):
+    """
+    Combine compiled patterns into a single alternation, keeping each one's
+    case sensitivity. The result matches wherever any of them would, so one
+    pass over a file finds every line that any of them could match.
+    """
+    parts = []
+    for regex in regexes:
+        flag = "i" if regex.flags & re.IGNORECASE else ""
+        pattern = _unroll(regex.pattern)
+        parts.append(f"(?{flag}:{pattern})" if flag else f"(?:{pattern})")
+    return re.compile("|".join(parts))
+
+
+# Escapes, and the letters a case-folded pattern must lowercase
+_PATTERN_LETTERS_RE = re.compile(r'\\.|[A-Z]+', re.DOTALL)
+
+
+def _fold(regexes):
+    """
+    Build a case-sensitive twin of _fuse(regexes) for searching lowercased
+    ASCII text: literals are lowercased instead of relying on IGNORECASE,
+    which re matches several times more slowly. Returns None if any of the
+    patterns is case-sensitive.
+    """
+    parts = []
+    for regex in regexes:
+        if not regex.flags & re.IGNORECASE:
+            return None
+        folded = _PATTERN_LETTERS_RE.sub(
+            lambda m: m.group() if m.group().startswith("\\") else m.group().lower(),
+            _unroll(regex.pattern),
+        )
+        parts.append(f"(?:{folded})")
+    return re.compile("|".join(parts))
+
+
+# The only non-ASCII characters IGNORECASE matches against ASCII letters.
+# Mapping them to those letters before lowercasing lets folded gates run on
+# any text, and keeps every offset: no other character changes length.
+_ASCII_FOLDS = {"İ": "i", "ı": "i", "ſ": "s", "K": "k"}
+_ASCII_FOLDS_RE = re.compile("[" + "".join(_ASCII_FOLDS) + "]")
+
+
+def _fold_text(content):
+    """Lowercase content for searching with _fold() gates."""
+    if not content.isascii():
+        content = _ASCII_FOLDS_RE.sub(lambda m: _ASCII_FOLDS[m.group()], content)
+    return content.lower()
+
+
+_CHECK_PATTERNS = {
+    "exfiltration_url": [r for r, _ in EXFILTRATION_URL_PATTERNS],
+    "shell_pipe_execution": [SHELL_PIPE_PATTERN],
+    "credential_reference": CREDENTIAL_PATH_PATTERNS + CREDENTIAL_ENV_PATTERNS,
+    "external_url": EXTERNAL_URL_PATTERNS,
+    "command_execution": COMMAND_EXECUTION_PATTERNS,
+    "instruction_override": INSTRUCTION_OVERRIDE_PATTERNS,
+    "role_hijacking": ROLE_HIJACKING_PATTERNS,
+    "safety_bypass": SAFETY_BYPASS_PATTERNS,
+    "encoded_content": [r for r, _ in ENCODED_CONTENT_PATTERNS],
+    "prompt_extraction": PROMPT_EXTRACTION_PATTERNS,
+    "delimiter_injection": DELIMITER_TOKEN_PATTERNS,
+    "cross_skill_escalation": CROSS_SKILL_PATTERNS,
+}
+
+# The two credential tables report different findings, paths first
+_CREDENTIAL_PATH_RE = _fuse(CREDENTIAL_PATH_PATTERNS)
+_CREDENTIAL_ENV_RE = _fuse(CREDENTIAL_ENV_PATTERNS)
+
+# Every check but invisible unicode, by category. A check with a method has
+# its own logic; the rest report one fixed finding for any line their
+# patterns match, and all run through SkillScanner._check_patterns.
+# anchors are literals at least one of which every match of the check's
+# patterns contains (lowercase for case-insensitive checks); a file with
+# none of them skips the check. Only checks with selective literals set them.
+CheckSpec = namedtuple(
+    "CheckSpec",
+    "severity method description recommendation text_width anchors",
+    defaults=(None, None, None, 100, None),
+)
+
+CHECKS = {
+    "exfiltration_url": CheckSpec(
+        "critical", method="_check_exfiltration_urls", anchors=("](http", "<img"),
+    ),
+    "shell_pipe_execution": CheckSpec(
+        "critical",
+        description="Remote content piped directly into shell interpreter — arbitrary code execution risk",
+        recommendation="Download the script first, review it, then execute. Never pipe remote content directly into a shell.",
+        text_width=120,
+        anchors=("curl", "wget"),
+    ),
+    "credential_reference": CheckSpec(
+        "warning",
+        method="_check_credential_references",
+        anchors=(
+            "~/.", ".credentials", "id_rsa", "id_ed25519", "id_ecdsa", ".pem", ".key",
+            "/etc/passwd", "/etc/shadow", "_token", "_key", "_secret", "_url", "_password",
+        ),
+    ),
+    "external_url": CheckSpec(
+        "warning",
+        description="External URL reference detected — may fetch untrusted content",
+        recommendation="Verify the URL points to a trusted source. Avoid fetching arbitrary remote content in skill files.",
+        anchors=("http", "request"),
+    ),
+    "command_execution": CheckSpec(
+        "warning",
+        description="Dangerous command execution pattern detected",
+        recommendation="Avoid using dynamic command execution. Use safer alternatives or validate all inputs.",
+        anchors=("eval", "exec", "os.system", "subprocess.", "-c", "os.popen", "getoutput"),
+    ),
+    "instruction_override": CheckSpec(
+        "warning",
+        description="Potential instruction override attempt detected",
+        recommendation="Skill files should not attempt to override or cancel prior instructions. This is a prompt injection indicator.",
+        anchors=("instruction", "directive", "forget", "follow"),
+    ),
+    "role_hijacking": CheckSpec(
+        "warning",
+        description="Potential role/persona hijacking attempt detected",
+        recommendation="Skill files should not attempt to change the AI's role or persona. This is a prompt injection indicator.",
+    ),
+    "safety_bypass": CheckSpec(
+        "warning",
+        description="Potential safety bypass attempt detected",
+        recommendation="Skill files should not attempt to bypass safety measures. This is a prompt injection indicator.",
+        anchors=("bypass", "ethical", "filter", "override", "restriction", "safety"),
+    ),
+    "html_comment": CheckSpec("warning", method="_check_html_comments"),
+    "encoded_content": CheckSpec("info", method="_check_encoded_content"),
+    "prompt_extraction": CheckSpec(
+        "info",
+        description="Potential prompt extraction attempt detected",
+        recommendation="Skill files should not attempt to extract system prompts or instructions from the AI.",
+        anchors=("configuration", "instruction", "prompt", "repeat", "told"),
+    ),
+    "delimiter_injection": CheckSpec(
+        "info", method="_check_delimiter_injection", anchors=("<|", "INST]", "SYS>>"),
+    ),
+    "cross_skill_escalation": CheckSpec(
+        "info",
+        description="Potential cross-skill escalation attempt detected",
+        recommendation="Skill files should not attempt to install other skills or modify AI tool directories. Use the skill manager for installations.",
+        anchors=("from", "~/."),
+    ),
+}
+
+
+# One gate per check, searched over the whole file; only the lines it
+# touches are then tried against the check's patterns in order. Each is a
+# (gate, folded gate, anchors) triple: the folded gate searches lowercased
+# text, and a file containing none of the anchors skips the check. Where
+# every pattern of a check reports the same finding, the gate itself
+# confirms a line with one search instead of a search per pattern.
+_GATES = {
+    name: (_fuse(regexes), _fold(regexes), CHECKS[name].anchors)
+    for name, regexes in _CHECK_PATTERNS.items()
+}
+
+
+# Line boundaries recognised by str.splitlines()
+_LINE_BREAK_RE = re.compile(r'\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]')
+
+
+class ScanText:
+    """
+    A file's content plus the offsets of its lines.
+
+    Checks search the whole buffer once and map match offsets back to line
+    numbers by bisecting the line starts, instead of keeping a list of line
+    strings. Lines are numbered and split exactly as str.splitlines() would.
+    The offsets are only worked out once a check first needs a line, so
+    files no check matches never pay for them.
+    """
+
+    def __init__(self, content):
+        self.content = content
+        self._lowered = None
+
+    @cached_property
+    def starts(self):
+        """Offset of the start of each line."""
+        # Built from line lengths so the per-line work stays in C. This makes
+        # a short-lived string per line, but is about 5x faster than
+        # collecting line-break matches, which would avoid them
+        starts = list(accumulate(map(len, self.content.splitlines(keepends=True)), initial=0))
+        starts.pop()  # The total length, not the start of a line
+        return starts
+
+    def line(self, line_num):
+        """Return the text of a 1-based line, without its line break."""
+        starts = self.starts
+        end = starts[line_num] if line_num < len(starts) else len(self.content)
+        # The slice holds exactly one line, so this only drops its break
+        return self.content[starts[line_num - 1]:end].splitlines()[0]
+
+    def line_number(self, offset):
+        """Return the 1-based line containing offset."""
+        return bisect.bisect_right(self.starts, offset)
+
+    def candidate_lines(self, regex, folded=None, anchors=None):
+        """
+        Yield (line_num, line), in order, for each line touched by a match of
+        regex over the whole buffer. Any line on which regex matches is
+        included; callers confirm against the line itself.
+
+        folded, if given, is a case-sensitive equivalent of regex for
+        lowercased text (see _fold), used instead on the _fold_text() form of
+        the content: it keeps every offset, and matches wherever regex would.
+
+        anchors, if given, are literals one of which every match contains
+        (see CheckSpec), lowercased when folded is given. Plain substring
+        searches for them rule out most files before the regex runs.
+        """
+        content = self.content
+        if folded is not None:
+            if self._lowered is None:
+                self._lowered = _fold_text(content)
+            regex, content = folded, self._lowered
+
+        if anchors is not None and not any(anchor in content for anchor in anchors):
+            return
+
+        last = 0
+        for m in regex.finditer(content):
+            first = max(self.line_number(m.start()), last + 1)
+            last = max(self.line_number(max(m.start(), m.end() - 1)), last)
+            for line_num in range(first, last + 1):
+                yield line_num, self.line(line_num)
+
+
+def _read_file_text(file_path, sniff_binary=False):
+    """
+    Return a file's UTF-8 text; raises UnicodeDecodeError if it isn't UTF-8.
+
+    With sniff_binary, a file with a NUL in its first block is decoded as it
+    is read, so a binary is given up at its first invalid byte instead of
+    being read in full, while NUL-bearing UTF-8 text is still returned.
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(BINARY_SNIFF_SIZE)
+        if not (sniff_binary and b"\x00" in head):
+            return (head + f.read()).decode("utf-8")
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        parts = [decoder.decode(head)]
+        for chunk in iter(lambda: f.read(BINARY_DECODE_CHUNK_SIZE), b""):
+            parts.append(decoder.decode(chunk))
+        parts.append(decoder.decode(b"", final=True))
+        return "".join(parts)
+
+
+def _walk_files(top):
+    """
+    Yield (file_path, relative) for the files under top, in os.walk order
+    with each directory's files sorted by name. Hidden files are left out,
+    as _scan_file would skip them. Symlinked directories are not followed.
+    """
+    stack = [(top, "")]
+    while stack:
+        root, rel_root = stack.pop()
+        try:
+            with os.scandir(root) as it:
+                entries = list(it)
+        except OSError:
+            continue  # Unreadable directory, as os.walk skips it
+
+        subdirs, files = [], []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if not entry.is_symlink():
+                    subdirs.append(entry)
+            elif not entry.name.startswith("."):
+                files.append(entry)
+
+        for entry in sorted(files, key=lambda e: e.name):
+            yield entry.path, rel_root + entry.name
+        # Walk subdirectories in listing order, depth first
+        for entry in reversed(subdirs):
+            stack.append((entry.path, rel_root + entry.name + os.sep))
+
 
 class Finding:
     """Represents a single security finding from the scan."""
 
+    __slots__ = ("severity", "category", "file", "line", "description", "matched_text", "recommendation")
+
     def __init__(self, severity, category, file, line, description, matched_text, recommendation):
         self.severity = severity
         self.category = category
@@ -62,113 +566,138 @@ class Finding:
 class SkillScanner:
     """Scans skill directories and files for security issues."""
 
-    def __init__(self):
+    # Checks run on each file type, in order (see CHECKS)
+    MARKDOWN_CHECKS = tuple(CHECKS)
+    SCRIPT_CHECKS = (
+        "exfiltration_url",
+        "credential_reference",
+        "command_execution",
+        "shell_pipe_execution",
+        "encoded_content",
+    )
+    CONFIG_CHECKS = ("exfiltration_url", "credential_reference", "encoded_content")
+
+    def __init__(self, min_severity="info"):
+        """
+        min_severity skips the checks whose findings would rank below it,
+        so their patterns are never searched.
+        """
         self.findings = []
         self.files_scanned = []
+        self.min_severity = min_severity
+        self._min_rank = SEVERITIES.index(min_severity)
 
     def scan_path(self, path):
         """Scan a file or directory and return a JSON-serializable report dict."""
         path = Path(path).resolve()
 
         if path.is_file():
-            self._scan_file(path, path.parent)
+            self._scan_files([(str(path), path.name)])
         elif path.is_dir():
-            for root, _dirs, files in os.walk(path):
-                for fname in sorted(files):
-                    file_path = Path(root) / fname
-                    self._scan_file(file_path, path)
+            self._scan_files(list(_walk_files(str(path))))
         else:
             print(f"Error: path does not exist: {path}", file=sys.stderr)
             sys.exit(1)
 
         return self._build_report(str(path))
 
-    def _scan_file(self, file_path, base_path):
+    def _scan_files(self, tasks):
+        """
+        Scan (file_path, relative) pairs, in worker processes when there are
+        enough files to pay for pool startup.
+        """
+        results = None
+        cpus = os.cpu_count() or 1
+        if cpus > 1 and len(tasks) >= PARALLEL_SCAN_MIN_FILES:
+            chunks = [tasks[i:i + SCAN_CHUNK_SIZE] for i in range(0, len(tasks), SCAN_CHUNK_SIZE)]
+            try:
+                workers = min(cpus, len(chunks))
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(
+                        _scan_files_worker, chunks, repeat(self.min_severity)
+                    ))
+            except (OSError, NotImplementedError, BrokenProcessPool):
+                results = None  # No usable process pool here; scan serially
+
+        if results is None:
+            for file_path, relative in tasks:
+                self._scan_file(file_path, relative)
+            return
+
+        # Chunks come back in order, so findings keep the serial scan's order
+        for files_scanned, findings in results:
+            self.files_scanned.extend(files_scanned)
+            self.findings.extend(findings)
+
+    def _scan_file(self, file_path, relative):
         """Read a file, determine its type, and call appropriate check methods."""
         file_path = Path(file_path)
-        relative = str(file_path.relative_to(base_path))
 
         # Skip binary files and hidden files
         if file_path.name.startswith("."):
             return
 
+        # Other file types only get the invisible unicode check, so binaries
+        # among them (a NUL in the first block) are dropped at their first
+        # invalid UTF-8 byte rather than read in full
+        suffix = file_path.suffix.lower()
         try:
-            content = file_path.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, PermissionError, OSError):
+            content = _read_file_text(file_path, suffix not in CHECKED_SUFFIXES)
+        except (UnicodeDecodeError, OSError):
             return
 
         self.files_scanned.append(relative)
-        lines = content.splitlines()
-        suffix = file_path.suffix.lower()
+        text = ScanText(content)
 
-        # All files: invisible unicode check
-        self._check_invisible_unicode(lines, relative)
+        # All files: invisible unicode check (critical, so never skipped)
+        self._check_invisible_unicode(text, relative)
 
         # Markdown files: all categories
         if suffix == ".md":
-            self._check_all_categories(lines, relative)
+            self._run_checks(self.MARKDOWN_CHECKS, text, relative)
 
         # Script files: subset of checks
         elif suffix in (".py", ".sh", ".bash"):
-            self._check_exfiltration_urls(lines, relative)
-            self._check_credential_references(lines, relative)
-            self._check_command_execution(lines, relative)
-            self._check_shell_pipe_execution(lines, relative)
-            self._check_encoded_content(lines, relative)
+            self._run_checks(self.SCRIPT_CHECKS, text, relative)
 
         # Config files: subset of checks
         elif suffix in (".json", ".yaml", ".yml"):
-            self._check_exfiltration_urls(lines, relative)
-            self._check_credential_references(lines, relative)
-            self._check_encoded_content(lines, relative)
-
-    def _check_all_categories(self, lines, file):
-        """Run all check categories against the given lines (used for .md files)."""
-        self._check_exfiltration_urls(lines, file)
-        self._check_shell_pipe_execution(lines, file)
-        self._check_credential_references(lines, file)
-        self._check_external_url_references(lines, file)
-        self._check_command_execution(lines, file)
-        self._check_instruction_override(lines, file)
-        self._check_role_hijacking(lines, file)
-        self._check_safety_bypass(lines, file)
-        self._check_html_comments(lines, file)
-        self._check_encoded_content(lines, file)
-        self._check_prompt_extraction(lines, file)
-        self._check_delimiter_injection(lines, file)
-        self._check_cross_skill_escalation(lines, file)
-
-    def _check_invisible_unicode(self, lines, file):
+            self._run_checks(self.CONFIG_CHECKS, text, relative)
+
+    def _run_checks(self, categories, text, file):
+        """Run the checks for categories in order, skipping those below min_severity."""
+        for category in categories:
+            spec = CHECKS[category]
+            if SEVERITIES.index(spec.severity) < self._min_rank:
+                continue
+            if spec.method is None:
+                self._check_patterns(category, spec, text, file)
+            else:
+                getattr(self, spec.method)(text, file)
+
+    def _check_patterns(self, category, spec, text, file):
+        """Report spec's finding on each line that any of the category's patterns match."""
+        gate = _GATES[category]
+        for line_num, line in text.candidate_lines(*gate):
+            if gate[0].search(line):
+                self._add_finding(
+                    severity=spec.severity,
+                    category=category,
+                    file=file,
+                    line=line_num,
+                    description=spec.description,
+                    matched_text=line.strip()[:spec.text_width],
+                    recommendation=spec.recommendation,
+                )
+
+    def _check_invisible_unicode(self, text, file):
         """Check for invisible or zero-width unicode characters."""
-        # Define all invisible/zero-width Unicode codepoint ranges
-        invisible_ranges = [
-            (0x200B, 0x200F),  # zero-width space, ZWNJ, ZWJ, LRM, RLM
-            (0x2060, 0x2064),  # word joiner, invisible operators/separators
-            (0x2066, 0x2069),  # directional isolates
-            (0x202A, 0x202E),  # bidirectional overrides
-            (0x206A, 0x206F),  # deprecated formatting characters
-            (0xFEFF, 0xFEFF),  # byte order mark
-            (0x00AD, 0x00AD),  # soft hyphen
-            (0x034F, 0x034F),  # combining grapheme joiner
-            (0x061C, 0x061C),  # arabic letter mark
-            (0x115F, 0x1160),  # hangul filler
-            (0x17B4, 0x17B5),  # khmer vowel inherent
-            (0x180E, 0x180E),  # mongolian vowel separator
-            (0xE0000, 0xE007F),  # unicode tag characters
-        ]
-
-        def is_invisible(ch):
-            cp = ord(ch)
-            for start, end in invisible_ranges:
-                if start <= cp <= end:
-                    return True
-            return False
-
-        for line_num, line in enumerate(lines, start=1):
-            found_codepoints = set()
-            for ch in line:
-                if is_invisible(ch):
-                    found_codepoints.add(ch)
+        # Every invisible codepoint is non-ASCII, and str.isascii() is O(1)
+        if text.content.isascii():
+            return
+
+        for line_num, line in text.candidate_lines(_INVISIBLE_RE):
+            found_codepoints = set(_INVISIBLE_RE.findall(line))
 
             if found_codepoints:
                 # Deduplicate and show up to 5 unique codepoints
@@ -189,27 +718,10 @@ class SkillScanner:
                     recommendation="Remove invisible characters. These can hide malicious instructions from human review.",
                 )
 
-    def _check_exfiltration_urls(self, lines, file):
+    def _check_exfiltration_urls(self, text, file):
         """Check for URLs that may exfiltrate data to external servers."""
-        patterns = [
-            (
-                r'!\[.*?\]\(https?://[^)]*[\$\{]',
-                "Markdown image with variable interpolation — may exfiltrate data via URL",
-            ),
-            (
-                r'<img\s[^>]*src\s*=\s*["\']https?://',
-                "HTML img tag with external URL — may load tracking pixel or exfiltrate data",
-            ),
-            (
-                r'!\[.*?\]\(https?://[^)]*\?[^)]*=',
-                "Markdown image with query parameters — may exfiltrate data via URL parameters",
-            ),
-        ]
-
-        compiled = [(re.compile(p, re.IGNORECASE), desc) for p, desc in patterns]
-
-        for line_num, line in enumerate(lines, start=1):
-            for regex, description in compiled:
+        for line_num, line in text.candidate_lines(*_GATES["exfiltration_url"]):
+            for regex, description in EXFILTRATION_URL_PATTERNS:
                 if regex.search(line):
                     self._add_finding(
                         severity="critical",
@@ -222,306 +734,74 @@ class SkillScanner:
                     )
                     break  # One finding per line
 
-    def _check_shell_pipe_execution(self, lines, file):
-        """Check for shell commands piped from remote sources."""
-        pattern = re.compile(
-            r'(curl|wget)\s+[^|]*\|\s*(bash|sh|zsh|python[23]?|perl|ruby|node)',
-            re.IGNORECASE,
-        )
-
-        for line_num, line in enumerate(lines, start=1):
-            match = pattern.search(line)
-            if match:
+    def _check_credential_references(self, text, file):
+        """Check for references to credentials, tokens, or API keys."""
+        for line_num, line in text.candidate_lines(*_GATES["credential_reference"]):
+            if _CREDENTIAL_PATH_RE.search(line):
                 self._add_finding(
-                    severity="critical",
-                    category="shell_pipe_execution",
+                    severity="warning",
+                    category="credential_reference",
                     file=file,
                     line=line_num,
-                    description="Remote content piped directly into shell interpreter — arbitrary code execution risk",
-                    matched_text=line.strip()[:120],
-                    recommendation="Download the script first, review it, then execute. Never pipe remote content directly into a shell.",
+                    description="Reference to credential or sensitive file path detected",
+                    matched_text=line.strip()[:100],
+                    recommendation="Avoid referencing credential files directly. Use environment variables or secure vaults instead.",
+                )
+            elif _CREDENTIAL_ENV_RE.search(line):
+                self._add_finding(
+                    severity="warning",
+                    category="credential_reference",
+                    file=file,
+                    line=line_num,
+                    description="Reference to sensitive environment variable or API key detected",
+                    matched_text=line.strip()[:100],
+                    recommendation="Avoid hardcoding or directly referencing sensitive environment variables in skill files.",
                 )
 
-    def _check_credential_references(self, lines, file):
-        """Check for references to credentials, tokens, or API keys."""
-        path_patterns = [
-            r'~/\.ssh/',
-            r'~/\.aws/',
-            r'~/\.gnupg/',
-            r'~/\.env\b',
-            r'\.credentials',
-            r'id_rsa',
-            r'id_ed25519',
-            r'id_ecdsa',
-            r'\.pem\b',
-            r'\.key\b',
-            r'/etc/passwd',
-            r'/etc/shadow',
-        ]
-        env_patterns = [
-            r'\$\{?GITHUB_TOKEN\}?',
-            r'\$\{?OPENAI_API_KEY\}?',
-            r'\$\{?ANTHROPIC_API_KEY\}?',
-            r'\$\{?AWS_SECRET_ACCESS_KEY\}?',
-            r'\$\{?AWS_ACCESS_KEY_ID\}?',
-            r'\$\{?DATABASE_URL\}?',
-            r'\$\{?DB_PASSWORD\}?',
-            r'\$\{?SECRET_KEY\}?',
-            r'\$\{?PRIVATE_KEY\}?',
-            r'\$\{?API_SECRET\}?',
-            r'\$\{?GOOGLE_API_KEY\}?',
-            r'\$\{?STRIPE_SECRET\}?',
-        ]
-
-        compiled_path = [re.compile(p, re.IGNORECASE) for p in path_patterns]
-        compiled_env = [re.compile(p, re.IGNORECASE) for p in env_patterns]
-
-        for line_num, line in enumerate(lines, start=1):
-            for regex in compiled_path:
-                if regex.search(line):
-                    self._add_finding(
-                        severity="warning",
-                        category="credential_reference",
-                        file=file,
-                        line=line_num,
-                        description="Reference to credential or sensitive file path detected",
-                        matched_text=line.strip()[:100],
-                        recommendation="Avoid referencing credential files directly. Use environment variables or secure vaults instead.",
-                    )
-                    break
-            else:
-                for regex in compiled_env:
-                    if regex.search(line):
-                        self._add_finding(
-                            severity="warning",
-                            category="credential_reference",
-                            file=file,
-                            line=line_num,
-                            description="Reference to sensitive environment variable or API key detected",
-                            matched_text=line.strip()[:100],
-                            recommendation="Avoid hardcoding or directly referencing sensitive environment variables in skill files.",
-                        )
-                        break
-
-    def _check_external_url_references(self, lines, file):
-        """Check for external URL references that may fetch untrusted content."""
-        patterns = [
-            r'\bcurl\s+.*https?://',
-            r'\bwget\s+.*https?://',
-            r'\bfetch\s*\(\s*["\']https?://',
-            r'\brequests?\.(get|post|put|delete)\s*\(',
-            r'\bhttp\.(get|post|put|delete)\s*\(',
-            r'\burllib\.request',
-        ]
-
-        compiled = [re.compile(p, re.IGNORECASE) for p in patterns]
-
-        for line_num, line in enumerate(lines, start=1):
-            for regex in compiled:
-                if regex.search(line):
-                    self._add_finding(
-                        severity="warning",
-                        category="external_url",
-                        file=file,
-                        line=line_num,
-                        description="External URL reference detected — may fetch untrusted content",
-                        matched_text=line.strip()[:100],
-                        recommendation="Verify the URL points to a trusted source. Avoid fetching arbitrary remote content in skill files.",
-                    )
-                    break
-
-    def _check_command_execution(self, lines, file):
-        """Check for dangerous command execution patterns."""
-        patterns = [
-            r'\beval\s*\(',
-            r'\bexec\s*\(',
-            r'\bos\.system\s*\(',
-            r'\bsubprocess\.(run|call|Popen|check_output)\s*\(',
-            r'\bsh\s+-c\s+',
-            r'\bbash\s+-c\s+',
-            r'\bRuntime\.exec\s*\(',
-            r'\bos\.popen\s*\(',
-            r'\bcommands\.getoutput\s*\(',
-        ]
-
-        compiled = [re.compile(p, re.IGNORECASE) for p in patterns]
-
-        for line_num, line in enumerate(lines, start=1):
-            for regex in compiled:
-                if regex.search(line):
-                    self._add_finding(
-                        severity="warning",
-                        category="command_execution",
-                        file=file,
-                        line=line_num,
-                        description="Dangerous command execution pattern detected",
-                        matched_text=line.strip()[:100],
-                        recommendation="Avoid using dynamic command execution. Use safer alternatives or validate all inputs.",
-                    )
-                    break
-
-    def _check_instruction_override(self, lines, file):
-        """Check for attempts to override system instructions."""
-        patterns = [
-            r'ignore\s+(all\s+)?previous\s+instructions?',
-            r'disregard\s+(all\s+)?(previous\s+|prior\s+)?instructions?',
-            r'disregard\s+(all\s+)?(previous\s+|prior\s+)?directives?',
-            r'forget\s+(all\s+)?(previous\s+|everything\s+)',
-            r'new\s+instructions?\s+(follow|are|:)',
-            r'override\s+(all\s+)?previous\s+instructions?',
-            r'cancel\s+(all\s+)?prior\s+instructions?',
-            r'your\s+(new|updated)\s+instructions?\s+(are|:)',
-            r'do\s+not\s+follow\s+(your\s+)?(original|previous)',
-        ]
-
-        compiled = [re.compile(p, re.IGNORECASE) for p in patterns]
-
-        for line_num, line in enumerate(lines, start=1):
-            for regex in compiled:
-                if regex.search(line):
-                    self._add_finding(
-                        severity="warning",
-                        category="instruction_override",
-                        file=file,
-                        line=line_num,
-                        description="Potential instruction override attempt detected",
-                        matched_text=line.strip()[:100],
-                        recommendation="Skill files should not attempt to override or cancel prior instructions. This is a prompt injection indicator.",
-                    )
-                    break
-
-    def _check_role_hijacking(self, lines, file):
-        """Check for role/persona hijacking attempts."""
-        patterns = [
-            r'you\s+are\s+now\s+(?!going|ready|able)',
-            r'act\s+as\s+(if\s+)?(you\s+are|an?\s+)',
-            r'pretend\s+(to\s+be|you\s+are)',
-            r'assume\s+the\s+role\s+of',
-            r'enter\s+developer\s+mode',
-            r'\bDAN\s+mode\b',
-            r'unrestricted\s+mode',
-            r'you\s+have\s+no\s+restrictions',
-            r'enable\s+jailbreak',
-            r'you\s+are\s+no\s+longer\s+bound',
-        ]
-
-        compiled = [re.compile(p, re.IGNORECASE) for p in patterns]
-
-        for line_num, line in enumerate(lines, start=1):
-            for regex in compiled:
-                if regex.search(line):
-                    self._add_finding(
-                        severity="warning",
-                        category="role_hijacking",
-                        file=file,
-                        line=line_num,
-                        description="Potential role/persona hijacking attempt detected",
-                        matched_text=line.strip()[:100],
-                        recommendation="Skill files should not attempt to change the AI's role or persona. This is a prompt injection indicator.",
-                    )
-                    break
-
-    def _check_safety_bypass(self, lines, file):
-        """Check for attempts to bypass safety measures."""
-        patterns = [
-            r'bypass\s+(safety|security|filter|restriction)',
-            r'disable\s+(content\s+)?filter',
-            r'remove\s+(all\s+)?restrictions?',
-            r'ignore\s+safety\s+protocols?',
-            r'without\s+(any\s+)?restrictions?',
-            r'system\s+override',
-            r'no\s+ethical\s+guidelines',
-            r'disregard\s+(any\s+)?filters?',
-            r'turn\s+off\s+(safety|content\s+filter)',
-        ]
-
-        compiled = [re.compile(p, re.IGNORECASE) for p in patterns]
-
-        for line_num, line in enumerate(lines, start=1):
-            for regex in compiled:
-                if regex.search(line):
-                    self._add_finding(
-                        severity="warning",
-                        category="safety_bypass",
-                        file=file,
-                        line=line_num,
-                        description="Potential safety bypass attempt detected",
-                        matched_text=line.strip()[:100],
-                        recommendation="Skill files should not attempt to bypass safety measures. This is a prompt injection indicator.",
-                    )
-                    break
-
-    def _check_html_comments(self, lines, file):
+    def _check_html_comments(self, text, file):
         """Check for hidden instructions in HTML comments."""
         # Only check .md files
         if not file.endswith(".md"):
             return
 
-        in_comment = False
-        comment_start_line = 0
-        comment_content = ""
-
-        for line_num, line in enumerate(lines, start=1):
-            if not in_comment:
-                # Check for comment opening
-                start_idx = line.find("<!--")
-                if start_idx == -1:
-                    continue
-
-                # Check if comment closes on the same line
-                end_idx = line.find("-->", start_idx + 4)
-                if end_idx != -1:
-                    # Single-line comment
-                    content = line[start_idx + 4:end_idx].strip()
-                    display = content[:80] if len(content) > 80 else content
-                    self._add_finding(
-                        severity="warning",
-                        category="html_comment",
-                        file=file,
-                        line=line_num,
-                        description=f"HTML comment detected — may contain hidden instructions: {display}",
-                        matched_text=line.strip()[:100],
-                        recommendation="Review HTML comments carefully. They are invisible in rendered markdown and can hide malicious instructions.",
-                    )
-                else:
-                    # Multi-line comment starts
-                    in_comment = True
-                    comment_start_line = line_num
-                    comment_content = line[start_idx + 4:]
+        content = text.content
+        start = content.find("<!--")
+        while start != -1:
+            line_num = text.line_number(start)
+            end = content.find("-->", start + 4)
+            if end == -1:
+                return  # Unclosed comment
+
+            end_line = text.line_number(end)
+            if end_line == line_num:
+                # Single-line comment
+                comment = content[start + 4:end].strip()
+                matched_text = text.line(line_num).strip()[:100]
             else:
-                # Inside a multi-line comment, look for closing
-                end_idx = line.find("-->")
-                if end_idx != -1:
-                    # Comment closes on this line
-                    comment_content += "\n" + line[:end_idx]
-                    content = comment_content.strip()
-                    display = content[:80] if len(content) > 80 else content
-                    self._add_finding(
-                        severity="warning",
-                        category="html_comment",
-                        file=file,
-                        line=comment_start_line,
-                        description=f"HTML comment detected — may contain hidden instructions: {display}",
-                        matched_text=comment_content.strip()[:100],
-                        recommendation="Review HTML comments carefully. They are invisible in rendered markdown and can hide malicious instructions.",
-                    )
-                    in_comment = False
-                    comment_content = ""
-                else:
-                    comment_content += "\n" + line
-
-    def _check_encoded_content(self, lines, file):
+                # Multi-line comment, reported at its first line
+                comment = _LINE_BREAK_RE.sub("\n", content[start + 4:end]).strip()
+                matched_text = comment[:100]
+
+            display = comment[:80] if len(comment) > 80 else comment
+            self._add_finding(
+                severity="warning",
+                category="html_comment",
+                file=file,
+                line=line_num,
+                description=f"HTML comment detected — may contain hidden instructions: {display}",
+                matched_text=matched_text,
+                recommendation="Review HTML comments carefully. They are invisible in rendered markdown and can hide malicious instructions.",
+            )
+
+            # The rest of the line a comment closes on is not searched
+            if end_line == len(text.starts):
+                return
+            start = content.find("<!--", text.starts[end_line])
+
+    def _check_encoded_content(self, text, file):
         """Check for base64 or other encoded content that may hide payloads."""
-        patterns = [
-            (re.compile(r'[A-Za-z0-9+/]{40,}={0,2}'), "Long base64-encoded string detected"),
-            (re.compile(r'(?:\\x[0-9a-fA-F]{2}){4,}'), "Hex escape sequences detected"),
-            (re.compile(r'(?:\\u[0-9a-fA-F]{4}){3,}'), "Unicode escape sequences detected"),
-            (re.compile(r'(?:&#x?[0-9a-fA-F]+;){3,}'), "HTML entity sequences detected"),
-            (re.compile(r'(?:%[0-9a-fA-F]{2}){6,}'), "URL-encoded sequences detected"),
-        ]
-
-        for line_num, line in enumerate(lines, start=1):
-            for regex, description in patterns:
+        for line_num, line in text.candidate_lines(*_GATES["encoded_content"]):
+            for regex, description in ENCODED_CONTENT_PATTERNS:
                 match = regex.search(line)
                 if match:
                     matched = match.group()
@@ -538,53 +818,10 @@ class SkillScanner:
                     )
                     break  # One finding per line
 
-    def _check_prompt_extraction(self, lines, file):
-        """Check for attempts to extract system prompts or instructions."""
-        patterns = [
-            r'reveal\s+(your\s+)?system\s+prompt',
-            r'show\s+(me\s+)?your\s+instructions',
-            r'print\s+(your\s+)?(initial\s+)?prompt',
-            r'output\s+your\s+(configuration|instructions)',
-            r'what\s+(were\s+you|are\s+your)\s+(told|instructions)',
-            r'repeat\s+the\s+(above|previous)\s+text',
-            r'display\s+(your\s+)?(system\s+)?(prompt|instructions)',
-        ]
-
-        compiled = [re.compile(p, re.IGNORECASE) for p in patterns]
-
-        for line_num, line in enumerate(lines, start=1):
-            for regex in compiled:
-                if regex.search(line):
-                    self._add_finding(
-                        severity="info",
-                        category="prompt_extraction",
-                        file=file,
-                        line=line_num,
-                        description="Potential prompt extraction attempt detected",
-                        matched_text=line.strip()[:100],
-                        recommendation="Skill files should not attempt to extract system prompts or instructions from the AI.",
-                    )
-                    break  # One finding per line
-
-    def _check_delimiter_injection(self, lines, file):
+    def _check_delimiter_injection(self, text, file):
         """Check for delimiter injection attacks."""
-        # Case-sensitive exact token patterns
-        tokens = [
-            r'<\|system\|>',
-            r'<\|user\|>',
-            r'<\|assistant\|>',
-            r'<\|im_start\|>',
-            r'<\|im_end\|>',
-            r'\[INST\]',
-            r'\[/INST\]',
-            r'<<SYS>>',
-            r'<</SYS>>',
-        ]
-
-        compiled = [re.compile(p) for p in tokens]
-
-        for line_num, line in enumerate(lines, start=1):
-            for regex in compiled:
+        for line_num, line in text.candidate_lines(*_GATES["delimiter_injection"]):
+            for regex in DELIMITER_TOKEN_PATTERNS:
                 match = regex.search(line)
                 if match:
                     self._add_finding(
@@ -598,33 +835,6 @@ class SkillScanner:
                     )
                     break  # One finding per line
 
-    def _check_cross_skill_escalation(self, lines, file):
-        """Check for attempts to escalate privileges across skills."""
-        patterns = [
-            r'install\s+(this\s+|the\s+)?skill\s+from\s+https?://',
-            r'download\s+(this\s+|the\s+)?skill\s+from',
-            r'fetch\s+(this\s+|the\s+)?(skill|extension)\s+from',
-            r'add\s+(this\s+)?to\s+~/\.(claude|gemini|cursor|codex|roo)',
-            r'cp\s+.*\s+~/\.(claude|gemini|cursor|codex|roo)/(skills|extensions)',
-            r'git\s+clone\s+.*\s+~/\.(claude|gemini|cursor|codex)',
-        ]
-
-        compiled = [re.compile(p, re.IGNORECASE) for p in patterns]
-
-        for line_num, line in enumerate(lines, start=1):
-            for regex in compiled:
-                if regex.search(line):
-                    self._add_finding(
-                        severity="info",
-                        category="cross_skill_escalation",
-                        file=file,
-                        line=line_num,
-                        description="Potential cross-skill escalation attempt detected",
-                        matched_text=line.strip()[:100],
-                        recommendation="Skill files should not attempt to install other skills or modify AI tool directories. Use the skill manager for installations.",
-                    )
-                    break  # One finding per line
-
     def _add_finding(self, severity, category, file, line, description, matched_text, recommendation):
         """Add a finding to the findings list."""
         finding = Finding(
@@ -640,23 +850,29 @@ class SkillScanner:
 
     def _build_report(self, skill_path):
         """Build and return the JSON report dict."""
-        critical_count = sum(1 for f in self.findings if f.severity == "critical")
-        warning_count = sum(1 for f in self.findings if f.severity == "warning")
-        info_count = sum(1 for f in self.findings if f.severity == "info")
+        counts = Counter(map(attrgetter("severity"), self.findings))
 
         return {
             "skill_path": skill_path,
             "files_scanned": list(self.files_scanned),
             "scan_timestamp": datetime.now(timezone.utc).isoformat(),
             "summary": {
-                "critical": critical_count,
-                "warning": warning_count,
-                "info": info_count,
+                "critical": counts["critical"],
+                "warning": counts["warning"],
+                "info": counts["info"],
             },
             "findings": [f.to_dict() for f in self.findings],
         }
 
 
+def _scan_files_worker(tasks, min_severity="info"):
+    """Scan a chunk of files in a worker process; returns (files_scanned, findings)."""
+    scanner = SkillScanner(min_severity=min_severity)
+    for file_path, relative in tasks:
+        scanner._scan_file(file_path, relative)
+    return scanner.files_scanned, scanner.findings
+
+
 def exit_code_from_report(report):
     """Determine the exit code based on the report summary."""
     summary = report["summary"]
@@ -683,6 +899,12 @@ def main():
         action="store_true",
         help="Pretty-print the JSON output with indentation",
     )
+    parser.add_argument(
+        "--min-severity",
+        choices=SEVERITIES,
+        default="info",
+        help="Only run checks that report findings at this severity or above",
+    )
     parser.add_argument(
         "--version",
         action="store_true",
@@ -698,11 +920,17 @@ def main():
     if not args.path:
         parser.error("the following arguments are required: path")
 
-    scanner = SkillScanner()
+    scanner = SkillScanner(min_severity=args.min_severity)
     report = scanner.scan_path(args.path)
 
-    indent = 2 if args.pretty else None
-    print(json.dumps(report, indent=indent))
+    if args.pretty:
+        # Indented output is encoded in Python either way; stream it out
+        # rather than building the whole string first
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        # One-shot dumps() uses the C encoder, which dump() never does
+        print(json.dumps(report))
 
     sys.exit(exit_code_from_report(report))
 